@@ -1,19 +1,26 @@
 # user_state.py
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 class UserState:
+    __slots__ = ('user_id', 'state', 'last_updated')
+
     def __init__(self, user_id: str, state: str, last_updated: Optional[datetime] = None):
         self.user_id = user_id
         self.state = state
-        self.last_updated = last_updated or datetime.utcnow()
+        self.last_updated = last_updated or _utcnow()
 
     def update_state(self, new_state: str):
         self.state = new_state
-        self.last_updated = datetime.utcnow()
+        self.last_updated = _utcnow()
 
 class AssessmentResult:
+    __slots__ = ('assessment_id', 'user_id', 'score', 'max_score')
+
     def __init__(self, assessment_id: str, user_id: str, score: float, max_score: float):
         self.assessment_id = assessment_id
         self.user_id = user_id
@@ -24,6 +31,8 @@ class AssessmentResult:
         return (self.score / self.max_score) * 100
 
 class AssessmentHistory:
+    __slots__ = ('user_id', 'assessments')
+
     def __init__(self, user_id: str):
         self.user_id = user_id
         self.assessments: List[AssessmentResult] = []
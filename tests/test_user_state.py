@@ -0,0 +1,92 @@
+"""
+Tests for the user state models.
+"""
+
+import pickle
+from datetime import datetime, timedelta, timezone
+
+from celestial_nexus.models.user_state import (
+    AssessmentHistory,
+    AssessmentResult,
+    UserState,
+)
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def test_user_state_keeps_explicit_last_updated():
+    """An explicit last_updated is returned unchanged."""
+    stamp = datetime(2020, 1, 1)
+    user = UserState("cosmic_001", "resonating", last_updated=stamp)
+    assert user.last_updated is stamp
+
+
+def test_update_state_sets_naive_utc_timestamp():
+    """update_state records a fresh naive UTC timestamp on every call."""
+    user = UserState("cosmic_001", "resonating", last_updated=datetime(2020, 1, 1))
+
+    before = _utcnow()
+    user.update_state("harmonized")
+    first = user.last_updated
+    user.update_state("aligned")
+    second = user.last_updated
+    after = _utcnow()
+
+    assert user.state == "aligned"
+    assert first.tzinfo is None
+    assert before <= first <= second <= after
+    assert second is not first
+    assert after - before < timedelta(seconds=5)
+
+
+def test_last_updated_assignment():
+    """last_updated is a plain attribute, including assignment of None."""
+    user = UserState("cosmic_001", "resonating")
+    stamp = datetime(2021, 6, 1)
+
+    user.last_updated = stamp
+    assert user.last_updated is stamp
+
+    user.last_updated = None
+    assert user.last_updated is None
+
+
+def test_user_state_pickle_roundtrip():
+    """An updated UserState survives a pickle round-trip."""
+    user = UserState("cosmic_001", "resonating")
+    user.update_state("harmonized")
+
+    restored = pickle.loads(pickle.dumps(user))
+
+    assert restored.user_id == "cosmic_001"
+    assert restored.state == "harmonized"
+    assert restored.last_updated == user.last_updated
+
+
+def test_assessment_result_pickle_roundtrip():
+    """An AssessmentResult survives a pickle round-trip."""
+    result = AssessmentResult("planetary_alignment_01", "cosmic_001", 85.5, 100.0)
+
+    restored = pickle.loads(pickle.dumps(result))
+
+    assert restored.assessment_id == "planetary_alignment_01"
+    assert restored.user_id == "cosmic_001"
+    assert restored.percentage() == 85.5
+
+
+def test_assessment_history_pickle_roundtrip():
+    """An AssessmentHistory keeps its assessments across a pickle round-trip."""
+    history = AssessmentHistory("cosmic_001")
+    history.add_assessment(
+        AssessmentResult("planetary_alignment_01", "cosmic_001", 92.0, 100.0)
+    )
+
+    restored = pickle.loads(pickle.dumps(history))
+
+    assert restored.user_id == "cosmic_001"
+    assert len(restored.assessments) == 1
+    latest = restored.get_latest_assessment()
+    assert latest.assessment_id == "planetary_alignment_01"
+    assert latest.score == 92.0